@@ -0,0 +1,68 @@
+# api/cursors.py
+import secrets, threading, time
+from collections import OrderedDict
+
+# --- Server-side store of ranked candidate lists for cursor pagination ---
+CURSOR_TTL_S = 600
+CURSOR_MAX_ENTRIES = 256
+
+
+class CursorStore:
+    """Bounded, TTL-evicted map of cursor key -> (request params, ranked results).
+
+    A cursor is "<key>.<offset>", so every page of one query shares a single
+    stored list and follow-up pages are plain slices (no re-scoring).
+    Entries are kept in creation order, so eviction only inspects the head.
+    The store is in-process only: indexes are loaded once at import, so a
+    restart (e.g. after an index rebuild) is what invalidates all cursors.
+    """
+
+    def __init__(self, ttl=CURSOR_TTL_S, max_entries=CURSOR_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self, now):
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if now - entry["created"] <= self.ttl and len(self._entries) <= self.max_entries:
+                break
+            del self._entries[key]
+
+    def put(self, params, results):
+        key = secrets.token_urlsafe(12)
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = {
+                "created": now,
+                "params": params,
+                "results": results,
+            }
+            self._evict(now)
+        return key
+
+    def page(self, cursor, top_k):
+        """Return (params, results, next_cursor) or None if the cursor is invalid."""
+        key, _, offset = (cursor or "").rpartition(".")
+        if not key or not (offset.isascii() and offset.isdigit()):
+            return None
+        offset = int(offset)
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+        results = entry["results"]
+        end = offset + top_k
+        next_cursor = f"{key}.{end}" if end < len(results) else None
+        return entry["params"], results[offset:end], next_cursor
+
+
+def first_page(store, params, results, top_k):
+    """Slice the first page and register the rest behind a cursor (if any)."""
+    if len(results) <= top_k:
+        return results, None
+    key = store.put(params, results)
+    return results[:top_k], f"{key}.{top_k}"
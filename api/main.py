@@ -1,16 +1,24 @@
 # api/main.py
+from typing import Optional
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from index.search_engine import hybrid_search
+from api.cursors import CursorStore, first_page
 
 app = FastAPI(title="SHL Assessment Recommender", version="1.0")
 
 class QueryRequest(BaseModel):
-    query: str
+    query: Optional[str] = None  # required unless paging with a cursor
     top_k: int = 10
-    w_semantic: float = 0.7
+    w_semantic: Optional[float] = None  # defaults to DEFAULT_W_SEMANTIC
+    cursor: Optional[str] = None
 
 API_VERSION = "rerank-v2"
+DEFAULT_W_SEMANTIC = 0.7
+
+# Size of the ranked candidate list kept behind a cursor (pages are sliced from it)
+CURSOR_POOL = 100
+cursors = CursorStore()
 
 @app.get("/health")
 def health():
@@ -19,9 +27,35 @@ def health():
 
 @app.post("/recommend")
 def recommend(req: QueryRequest):
+    if req.top_k < 1:
+        raise HTTPException(status_code=422, detail="top_k must be >= 1")
+    if req.cursor:
+        page = cursors.page(req.cursor, req.top_k)
+        if page is None:
+            raise HTTPException(status_code=410, detail="cursor expired or invalid")
+        params, results, next_cursor = page
+        # A cursor is bound to the query it was issued for; never page silently
+        # through another query's results.
+        if (req.query is not None and req.query != params["query"]) or (
+            req.w_semantic is not None and req.w_semantic != params["w_semantic"]
+        ):
+            raise HTTPException(
+                status_code=422, detail="cursor does not match query/w_semantic"
+            )
+        return {"query": params["query"], "results": results, "next_cursor": next_cursor}
+    if not req.query:
+        raise HTTPException(status_code=422, detail="query is required")
+    w_semantic = DEFAULT_W_SEMANTIC if req.w_semantic is None else req.w_semantic
     try:
-        results = hybrid_search(req.query, top_k=req.top_k, w_semantic=req.w_semantic)
-        return {"query": req.query, "results": results}
+        ranked = hybrid_search(
+            req.query,
+            top_k=req.top_k,
+            w_semantic=w_semantic,
+            n_return=max(req.top_k, CURSOR_POOL),
+        )
+        params = {"query": req.query, "w_semantic": w_semantic}
+        results, next_cursor = first_page(cursors, params, ranked, req.top_k)
+        return {"query": req.query, "results": results, "next_cursor": next_cursor}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
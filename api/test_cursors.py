@@ -0,0 +1,61 @@
+# api/test_cursors.py
+import pytest
+from api import cursors
+from api.cursors import CursorStore, first_page
+
+PARAMS = {"query": "java developer", "w_semantic": 0.7}
+RESULTS = list(range(25))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(cursors.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_pages_are_slices_until_last_page():
+    store = CursorStore()
+    page, cur = first_page(store, PARAMS, RESULTS, 10)
+    assert page == RESULTS[:10]
+
+    params, page, cur = store.page(cur, 10)
+    assert params == PARAMS
+    assert page == RESULTS[10:20]
+
+    _, page, cur = store.page(cur, 10)
+    assert page == RESULTS[20:]
+    assert cur is None
+
+
+def test_no_cursor_when_everything_fits():
+    store = CursorStore()
+    page, cur = first_page(store, PARAMS, RESULTS, 25)
+    assert page == RESULTS
+    assert cur is None
+
+
+def test_ttl_expiry(clock):
+    store = CursorStore(ttl=10)
+    _, cur = first_page(store, PARAMS, RESULTS, 10)
+    clock[0] = 10
+    assert store.page(cur, 10) is not None
+    clock[0] = 10.5
+    assert store.page(cur, 10) is None
+
+
+def test_oldest_entry_evicted_at_max_entries():
+    store = CursorStore(max_entries=2)
+    first = first_page(store, PARAMS, RESULTS, 10)[1]
+    second = first_page(store, PARAMS, RESULTS, 10)[1]
+    third = first_page(store, PARAMS, RESULTS, 10)[1]
+    assert store.page(first, 10) is None
+    assert store.page(second, 10) is not None
+    assert store.page(third, 10) is not None
+
+
+@pytest.mark.parametrize("cursor", ["abc", "k.-1", "k.²", "", None, "unknown.10"])
+def test_malformed_or_unknown_cursor(cursor):
+    store = CursorStore()
+    first_page(store, PARAMS, RESULTS, 10)
+    assert store.page(cursor, 10) is None
@@ -0,0 +1,71 @@
+# api/test_main.py
+import os
+from pathlib import Path
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+pytest.importorskip("rank_bm25")
+
+# Index files are stored in Git LFS; without them there is nothing to search.
+if Path("index/meta.pkl").read_bytes()[:40].startswith(b"version https://git-lfs"):
+    pytest.skip("index files not fetched (git lfs pull)", allow_module_level=True)
+
+# BM25-only mode: no FAISS / sentence-transformers needed.
+os.environ["SEMANTIC"] = "0"
+
+from fastapi.testclient import TestClient
+from api import main
+from index.search_engine import hybrid_search
+
+QUERY = "java developer who can collaborate, 40 minutes"
+TOP_K = 5
+
+client = TestClient(main.app)
+
+
+def _recommend(**body):
+    return client.post("/recommend", json=body)
+
+
+def test_page_one_matches_plain_search_and_page_two_is_next_slice():
+    ranked = hybrid_search(QUERY, top_k=TOP_K, n_return=main.CURSOR_POOL)
+
+    r = _recommend(query=QUERY, top_k=TOP_K)
+    assert r.status_code == 200
+    body = r.json()
+    assert body["results"] == hybrid_search(QUERY, top_k=TOP_K)
+    assert body["next_cursor"]
+
+    r = _recommend(cursor=body["next_cursor"], top_k=TOP_K)
+    assert r.status_code == 200
+    assert r.json()["query"] == QUERY
+    assert r.json()["results"] == ranked[TOP_K : 2 * TOP_K]
+
+
+@pytest.mark.parametrize(
+    "override", [{"query": "sales manager"}, {"w_semantic": 0.2}]
+)
+def test_cursor_reused_with_different_params_is_422(override):
+    cursor = _recommend(query=QUERY, top_k=TOP_K).json()["next_cursor"]
+    r = _recommend(cursor=cursor, top_k=TOP_K, **override)
+    assert r.status_code == 422
+
+
+def test_cursor_with_matching_query_is_accepted():
+    cursor = _recommend(query=QUERY, top_k=TOP_K).json()["next_cursor"]
+    r = _recommend(query=QUERY, cursor=cursor, top_k=TOP_K)
+    assert r.status_code == 200
+
+
+@pytest.mark.parametrize("cursor", ["unknown.5", "k.²"])
+def test_unknown_cursor_is_410(cursor):
+    assert _recommend(cursor=cursor, top_k=TOP_K).status_code == 410
+
+
+def test_missing_query_is_422():
+    assert _recommend(top_k=TOP_K).status_code == 422
+
+
+def test_non_positive_top_k_is_422():
+    assert _recommend(query=QUERY, top_k=0).status_code == 422
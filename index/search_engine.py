@@ -174,7 +174,10 @@ def metadata_boost(
 
 
 # --- Hybrid search combining semantic + BM25 + metadata rerank ---
-def hybrid_search(query, top_k=10, w_semantic=0.7):
+# n_return (default top_k) only widens the returned list; the boosted
+# candidate window still follows top_k, so the first top_k are unchanged.
+def hybrid_search(query, top_k=10, w_semantic=0.7, n_return=None):
+    n_return = top_k if n_return is None else max(n_return, top_k)
     order, bm = _bm25(query)
     bm_norm = bm
     cons = parse_constraints(query)
@@ -184,7 +187,7 @@ def hybrid_search(query, top_k=10, w_semantic=0.7):
         cand = order[: max(top_k * 8, 50)]
         boost = metadata_boost(cand, bm_norm, cons)
         combined = bm_norm + boost
-        top = np.argsort(combined)[::-1][:top_k]
+        top = np.argsort(combined)[::-1][:n_return]
         return [
             {
                 "name": meta["titles"][i],
@@ -206,7 +209,7 @@ def hybrid_search(query, top_k=10, w_semantic=0.7):
     cand = np.argsort(combined)[::-1][: max(top_k * 8, 100)]
     boost = metadata_boost(cand, combined, cons)
     combined2 = combined + boost
-    top = np.argsort(combined2)[::-1][:top_k]
+    top = np.argsort(combined2)[::-1][:n_return]
 
     return [
         {